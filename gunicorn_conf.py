@@ -0,0 +1,20 @@
+"""
+Gunicorn configuration for Cloud Run deployment
+"""
+import multiprocessing
+import os
+
+# Cloud Run sets PORT automatically
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+
+# The app is I/O bound (ESPN fetches), so threaded workers carry most of the
+# concurrency; multiple workers keep one busy process from serializing requests
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = 4
+
+# ESPN can be slow; match the generous timeout the old CMD used
+timeout = 300
+
+# Keep connections open longer than Cloud Run's load balancer idle timeout
+keepalive = 75
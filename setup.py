@@ -7,8 +7,40 @@ import subprocess
 import sys
 import os
 
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python < 3.8
+    importlib_metadata = None
+
+def requirements_satisfied():
+    """Check requirements.txt against installed versions without running pip"""
+    if importlib_metadata is None:
+        return False
+    try:
+        with open("requirements.txt") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if "==" in line:
+                    name, required = line.split("==", 1)
+                else:
+                    name, required = line, None
+                try:
+                    installed = importlib_metadata.version(name)
+                except importlib_metadata.PackageNotFoundError:
+                    return False
+                if required and installed != required:
+                    return False
+    except OSError:
+        return False
+    return True
+
 def install_requirements():
     """Install required Python packages"""
+    if requirements_satisfied():
+        print("✅ Dependencies already satisfied, skipping pip")
+        return True
     print("Installing Python dependencies...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
@@ -43,8 +75,8 @@ def main():
     print("=" * 40)
     
     # Check Python version
-    if sys.version_info < (3, 7):
-        print("❌ Python 3.7+ required")
+    if sys.version_info < (3, 10):
+        print("❌ Python 3.10+ required")
         sys.exit(1)
     
     print(f"✅ Python {sys.version.split()[0]} detected")
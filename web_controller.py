@@ -6,13 +6,18 @@ Web-based interface for configuring and monitoring the NFL redzone controller.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import re
 import time
 import json
 import threading
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from flask import Flask, render_template, request, jsonify, redirect, url_for, g
 from flask_cors import CORS
 import logging
@@ -28,6 +33,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class RepeatMessageFilter(logging.Filter):
+    """Suppress a log line when the identical message was emitted within the
+    window - per-tick detection messages otherwise repeat every poll"""
+
+    WINDOW_SECONDS = 60
+    MAX_TRACKED = 1000
+
+    def __init__(self):
+        super().__init__()
+        self._last_seen = {}
+
+    def filter(self, record):
+        # Only dedupe routine levels; warnings and errors always pass
+        if record.levelno > logging.INFO:
+            return True
+
+        message = record.getMessage()
+        now = time.time()
+        last = self._last_seen.get(message)
+
+        # Only count from the last *emitted* occurrence - refreshing the
+        # timestamp on suppressed records would turn the window into a
+        # sliding one that silences a recurring message indefinitely
+        if last is not None and now - last <= self.WINDOW_SECONDS:
+            return False
+
+        if len(self._last_seen) > self.MAX_TRACKED:
+            self._last_seen.clear()
+        self._last_seen[message] = now
+        return True
+
+logger.addFilter(RepeatMessageFilter())
+
 # Firebase Admin for multi-user authentication
 try:
     import firebase_admin
@@ -37,10 +75,50 @@ except ImportError:
     FIREBASE_AVAILABLE = False
     logger.warning("firebase-admin not installed. Multi-user support disabled.")
 
+# orjson for faster ESPN JSON parsing (optional - stdlib json works too)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# flask-compress for gzipped JSON responses (optional)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
 app = Flask(__name__)
 # Enable CORS for all routes (allows Expo web app to connect)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
+# Gzip the JSON payloads (repetitive per-game keys compress ~6-10x);
+# clients that don't send Accept-Encoding: gzip are unaffected
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson - 2-5x faster than stdlib
+        json on the games payloads and serializes straight to bytes"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+    app.json = OrjsonProvider(app)
+
 # Initialize Firebase Admin (optional - for multi-user support)
 firebase_initialized = False
 if FIREBASE_AVAILABLE:
@@ -64,29 +142,54 @@ if FIREBASE_AVAILABLE:
         logger.warning(f"Could not initialize Firebase Admin: {e}")
         logger.info("Server will continue with single-user mode (backward compatible)")
 
+# Verified-token cache: sha256(token) -> (expires_at, uid). verify_id_token
+# does RSA signature verification (and occasional Google key fetches) per
+# call, which adds up when every poll carries the same bearer token.
+_token_cache: Dict[str, Tuple[float, str]] = {}
+_token_cache_lock = threading.Lock()
+TOKEN_CACHE_TTL = 300
+TOKEN_CACHE_MAX = 10000
+
 def get_user_from_token() -> Optional[str]:
     """Extract and verify Firebase token from request, return user_id"""
     if not firebase_initialized:
         return None
-    
+
     try:
         # Get token from Authorization header
         auth_header = request.headers.get('Authorization', '')
         if not auth_header.startswith('Bearer '):
             return None
-        
+
         token = auth_header[7:]  # Remove 'Bearer ' prefix
-        
+
+        # Serve repeat tokens from the cache while they're still valid
+        key = hashlib.sha256(token.encode()).hexdigest()
+        now = time.time()
+        with _token_cache_lock:
+            entry = _token_cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
         # Verify token with Firebase
         decoded_token = auth.verify_id_token(token)
         user_id = decoded_token['uid']
-        logger.debug(f"Authenticated user: {user_id}")
+
+        # Cache until the token expires, at most 5 minutes
+        expires_at = min(now + TOKEN_CACHE_TTL,
+                         float(decoded_token.get('exp', now + TOKEN_CACHE_TTL)))
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAX:
+                _token_cache.clear()
+            _token_cache[key] = (expires_at, user_id)
+
+        logger.debug("Authenticated user: %s", user_id)
         return user_id
     except Exception as e:
-        logger.debug(f"Token verification failed: {e}")
+        logger.debug("Token verification failed: %s", e)
         return None
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Represents a football game (NFL or College Football) with its details"""
     event_id: str
@@ -119,6 +222,42 @@ class Game:
     down: Optional[int] = None  # Current down (1-4)
     distance: Optional[int] = None  # Yards to go (e.g., 1, 10)
     game_excitement_score: float = 0.0  # Calculated by server based on game state
+    # Internal detection state (not serialized): markers of the previously
+    # seen play, used to clear timeout/commercial windows
+    _last_play_id: Optional[str] = None
+    _last_timeout_play_text: Optional[str] = None
+    _last_commercial_play_text: Optional[str] = None
+    # Redzone result from the last play change, served while the play id is
+    # unchanged so repeat polls skip the parse work
+    _redzone_result: Optional[Tuple[str, int]] = None
+    # Base (game-state) excitement computed by update_game_state; folded into
+    # game_excitement_score by calculate_excitement_score
+    _base_excitement: float = 0.0
+    # Normalized team names, computed once at construction: possession
+    # matching runs per game per tick and would otherwise re-uppercase and
+    # re-split the same names on every pass
+    _home_upper: str = ''
+    _away_upper: str = ''
+    _home_word_prefixes: frozenset = frozenset()
+    _away_word_prefixes: frozenset = frozenset()
+
+    def __post_init__(self):
+        self._home_upper = self.home_team.upper()
+        self._away_upper = self.away_team.upper()
+        self._home_word_prefixes = frozenset(
+            word[:2] for word in self._home_upper.split() if len(word) >= 2)
+        self._away_word_prefixes = frozenset(
+            word[:2] for word in self._away_upper.split() if len(word) >= 2)
+
+    def to_dict(self) -> Dict:
+        """Shallow dict of all public fields for JSON serialization - every
+        field is already a primitive, so asdict()'s recursive deep copy is
+        wasted work"""
+        return {name: getattr(self, name) for name in GAME_FIELD_NAMES}
+
+# Field name tuple resolved once, not per serialization; underscore fields
+# are internal detection state and stay out of the API payload
+GAME_FIELD_NAMES = tuple(f.name for f in fields(Game) if not f.name.startswith('_'))
 
 class ESPNClient:
     """Client for interacting with ESPN API v3"""
@@ -159,50 +298,222 @@ class ESPNClient:
         
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip'
         })
+        # Keep-alive connection pooling with retries - default pool sizes
+        # churn TLS handshakes under repeated polling of the two ESPN hosts
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # ETag conditional-GET cache: url -> etag and last parsed body.
+        # ESPN feeds frequently return identical JSON between polls, so a
+        # 304 skips both the body transfer and the re-parse.
+        self._etags: Dict[str, str] = {}
+        self._etag_cache: Dict[str, Dict] = {}
+        self._etag_lock = threading.Lock()
+
+        # Short-TTL scoreboard cache: one fetch per tick serves discovery
+        # plus every per-game situation lookup (previously N re-downloads)
+        self._scoreboard_cache: Optional[Dict] = None
+        self._scoreboard_ts = 0.0
+        self._scoreboard_ttl = 5.0
+        self._events_by_id: Dict[str, Dict] = {}
+        self._scoreboard_lock = threading.Lock()
+
+        # Summaries get requested more than once per tick for the same game
+        # (discovery fallback + state update), so cache those briefly too
+        self._summary_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._summary_ttl = 5.0
+
+    def _get_scoreboard(self) -> Dict:
+        """Fetch the scoreboard, reusing the cached copy within the TTL and
+        keeping an id -> event index for O(1) per-game lookups"""
+        with self._scoreboard_lock:
+            if (self._scoreboard_cache is not None and
+                    time.time() - self._scoreboard_ts < self._scoreboard_ttl):
+                return self._scoreboard_cache
+
+        data = self._get_json(self.scoreboard_url)
+
+        with self._scoreboard_lock:
+            self._scoreboard_cache = data
+            self._scoreboard_ts = time.time()
+            self._events_by_id = {
+                event.get('id'): event for event in data.get('events', [])
+            }
+        return data
+
+    def _get_json(self, url: str) -> Dict:
+        """GET a JSON document, using If-None-Match so an unchanged feed
+        comes back as a 304 and we reuse the previously parsed dict"""
+        headers = {}
+        with self._etag_lock:
+            etag = self._etags.get(url)
+        if etag:
+            headers['If-None-Match'] = etag
+
+        response = self.session.get(url, headers=headers, timeout=10)
+
+        if response.status_code == 304:
+            with self._etag_lock:
+                cached = self._etag_cache.get(url)
+            if cached is not None:
+                return cached
+            # Cached body was lost somehow - fall back to a plain GET
+            response = self.session.get(url, timeout=10)
+
+        response.raise_for_status()
+        # orjson is 2-3x faster than stdlib json on the larger ESPN payloads
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+
+        new_etag = response.headers.get('ETag')
+        if new_etag:
+            with self._etag_lock:
+                self._etags[url] = new_etag
+                self._etag_cache[url] = data
+
+        return data
     
     def get_live_games(self) -> List[Dict]:
         """Fetch all current games from scoreboard"""
         try:
-            response = self.session.get(self.scoreboard_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_scoreboard()
             return data.get('events', [])
         except Exception as e:
             logger.error(f"Error fetching live games for {self.league_name}: {e}")
             return []
-    
+
     def get_game_summary(self, event_id: str) -> Optional[Dict]:
         """Get detailed game information including team names and current situation"""
         try:
+            cached = self._summary_cache.get(event_id)
+            if cached and time.time() - cached[0] < self._summary_ttl:
+                return cached[1]
+
             url = f"{self.summary_url}?event={event_id}"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+            data = self._get_json(url)
+            self._summary_cache[event_id] = (time.time(), data)
+            return data
         except Exception as e:
             logger.error(f"Error fetching game summary for {event_id} ({self.league_name}): {e}")
             return None
-    
+
+    def get_event(self, event_id: str) -> Optional[Dict]:
+        """Get the full scoreboard event for a game (cached per tick)"""
+        try:
+            self._get_scoreboard()
+            return self._events_by_id.get(event_id)
+        except Exception as e:
+            logger.error(f"Error fetching event {event_id} ({self.league_name}): {e}")
+            return None
+
     def get_game_situation(self, event_id: str) -> Optional[Dict]:
         """Get current game situation from scoreboard (faster than summary)"""
         try:
-            # Get from scoreboard for speed
-            response = self.session.get(self.scoreboard_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Find the specific game
-            for event in data.get('events', []):
-                if event.get('id') == event_id:
-                    competitions = event.get('competitions', [{}])[0]
-                    return competitions.get('situation', {})
-            
+            # Served from the cached scoreboard within the TTL
+            self._get_scoreboard()
+
+            event = self._events_by_id.get(event_id)
+            if event:
+                competitions = event.get('competitions', [{}])[0]
+                return competitions.get('situation', {})
+
             return None
         except Exception as e:
             logger.error(f"Error fetching game situation for {event_id} ({self.league_name}): {e}")
             return None
 
+# NFL team abbreviation -> display name, as used by ESPN drive/field-position
+# text (e.g. "WSH 11"). Built once at module load; WAS/WSH and LA variants
+# both appear in ESPN data depending on endpoint.
+TEAM_ABBREV_MAP = {
+    'ARI': 'Arizona Cardinals',
+    'ATL': 'Atlanta Falcons',
+    'BAL': 'Baltimore Ravens',
+    'BUF': 'Buffalo Bills',
+    'CAR': 'Carolina Panthers',
+    'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals',
+    'CLE': 'Cleveland Browns',
+    'DAL': 'Dallas Cowboys',
+    'DEN': 'Denver Broncos',
+    'DET': 'Detroit Lions',
+    'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans',
+    'IND': 'Indianapolis Colts',
+    'JAX': 'Jacksonville Jaguars',
+    'KC': 'Kansas City Chiefs',
+    'LAC': 'Los Angeles Chargers',
+    'LAR': 'Los Angeles Rams',
+    'LV': 'Las Vegas Raiders',
+    'MIA': 'Miami Dolphins',
+    'MIN': 'Minnesota Vikings',
+    'NE': 'New England Patriots',
+    'NO': 'New Orleans Saints',
+    'NYG': 'New York Giants',
+    'NYJ': 'New York Jets',
+    'PHI': 'Philadelphia Eagles',
+    'PIT': 'Pittsburgh Steelers',
+    'SEA': 'Seattle Seahawks',
+    'SF': 'San Francisco 49ers',
+    'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans',
+    'WAS': 'Washington Commanders',
+    'WSH': 'Washington Commanders',
+}
+
+# Break keywords scanned out of play text in one compiled pass instead of
+# four separate substring scans per play
+PLAY_BREAK_RE = re.compile(r'timeout|end quarter|end half|end of')
+END_OF_PERIOD_HITS = frozenset({'end of', 'end quarter', 'end half'})
+
+# Ball-location patterns like "to the PSU13", "at DAL20", "to WSH5" — the
+# abbreviation before the yard number identifies whose side the ball is on
+POSSESSION_LOCATION_RE = re.compile(
+    r'to\s+(?:the\s+)?([A-Z]{2,4})\d+|at\s+([A-Z]{2,4})\d+', re.IGNORECASE)
+
+# Yards-to-go from downDistanceText, e.g. "1st & 10" -> 10
+DISTANCE_RE = re.compile(r'&\s*(\d+)')
+
+# Down number from downDistanceText - one compiled scan instead of eight
+# substring checks (down and distance stay separate searches because ESPN
+# emits forms like "1st & Goal" where only one of the two is present)
+DOWN_RE = re.compile(r'1st|first|2nd|second|3rd|third|4th|fourth', re.IGNORECASE)
+DOWN_MAP = {'1st': 1, 'first': 1, '2nd': 2, 'second': 2,
+            '3rd': 3, 'third': 3, '4th': 4, 'fourth': 4}
+
+# Close-game bonus indexed by absolute score difference (0-14); anything
+# wider gets nothing. Replaces a per-game if/elif ladder with one index.
+CLOSE_GAME_BONUS = tuple([1000] * 4 + [500] * 4 + [200] * 3 + [50] * 4)
+
+# Reverse of TEAM_ABBREV_MAP for the common case where a drive-text
+# abbreviation can be resolved by direct equality (duplicate-abbreviation
+# teams keep whichever entry came last; the substring fallback covers the rest)
+NAME_TO_ABBREV = {name: abbrev for abbrev, name in TEAM_ABBREV_MAP.items()}
+
+
+def _split_home_away(competitors: List[Dict]) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Split a scoreboard competitors list into (home, away) in one pass"""
+    home = away = None
+    for comp in competitors:
+        side = comp.get('homeAway')
+        if side == 'home':
+            if home is None:
+                home = comp
+        elif side == 'away' and away is None:
+            away = comp
+    return home, away
+
 # Remote provider URLs
 REMOTE_PROVIDERS = {
     'ROGERS': 'https://rogers.webremote.com/remote',
@@ -219,211 +530,261 @@ class NFLRedzoneController:
         # Create ESPN clients for both leagues
         self.nfl_client = ESPNClient('nfl')
         self.college_client = ESPNClient('college-football')
+        # Shared thread pool for fanning out per-game ESPN requests
+        # (I/O bound - a single slow endpoint shouldn't serialize the refresh)
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        # Team display names are immutable for an event, so remember them
+        # and skip the summary round trip on re-discovery
+        self._team_name_cache: Dict[str, Tuple[str, str]] = {}
+        # Live Game objects persist across polls (keyed by event id) so
+        # per-play state - _last_play_id, _redzone_result, the timeout and
+        # commercial markers - survives between refreshes instead of being
+        # rebuilt from scratch every tick
+        self._games_by_event: Dict[str, Game] = {}
+        # Cached /api/status payload - dashboards poll faster than game
+        # state meaningfully changes, so reuse the built list briefly
+        self._status_payload: Optional[List[Dict]] = None
+        self._status_payload_ts = 0.0
+        self._status_payload_ttl = 5.0
+        self._status_payload_lock = threading.Lock()
+        # /api/all_games cache: (fetched_at, date_key, ttl, payload).
+        # TTL is short while games are live, long otherwise.
+        self._all_games_cache: Optional[Tuple[float, str, float, List[Dict]]] = None
+        self._all_games_lock = threading.Lock()
     
     
-    def get_live_games(self) -> Dict[str, Game]:
-        """Fetch all current live games from both NFL and College Football and calculate excitement scores"""
-        games: Dict[str, Game] = {}
-        
-        # Discover NFL games
-        nfl_games = self.nfl_client.get_live_games()
-        for game_data in nfl_games:
-            try:
-                # ESPN API v3 returns events with 'id' field, not '$ref'
-                event_id = game_data.get('id')
-                if not event_id:
-                    continue
-                
-                # Check if game is actually live from the event status
-                status = game_data.get('status', {})
-                status_type = status.get('type', {})
-                is_live = status_type.get('state', '') == 'in'
-                
-                # Only process live games
-                if not is_live:
-                    continue
-                
-                summary = self.nfl_client.get_game_summary(event_id)
-                
-                if summary and 'boxscore' in summary:
-                    teams = summary['boxscore'].get('teams', [])
-                    if len(teams) >= 2:
-                        home_team = teams[1].get('team', {}).get('displayName', 'Unknown')
-                        away_team = teams[0].get('team', {}).get('displayName', 'Unknown')
-                        
-                        game = Game(
-                            event_id=event_id,
-                            home_team=home_team,
-                            away_team=away_team,
-                            league='nfl',
-                            is_live=is_live
-                        )
-                        
-                        game_key = f"{away_team} @ {home_team}"
-                        games[game_key] = game
-            except Exception as e:
-                logger.error(f"Error processing NFL game: {e}")
+    @staticmethod
+    def _team_names_from_event(event: Dict) -> Optional[Tuple[str, str]]:
+        """Extract (home, away) display names embedded in a scoreboard event"""
+        competitions = event.get('competitions', [])
+        if not competitions:
+            return None
+        home, away = _split_home_away(competitions[0].get('competitors', []))
+        if not home or not away:
+            return None
+        return (home.get('team', {}).get('displayName', 'Unknown'),
+                away.get('team', {}).get('displayName', 'Unknown'))
+
+    @staticmethod
+    def _parse_scheduled_event(event: Dict, league: str) -> Optional[Dict]:
+        """Flatten a scoreboard event into the /api/all_games dict shape"""
+        competitions = event.get('competitions', [])
+        if not competitions:
+            return None
+        competitors = competitions[0].get('competitors', [])
+        if len(competitors) < 2:
+            return None
+        home, away = _split_home_away(competitors)
+        if not home or not away:
+            return None
+        status_type = event.get('status', {}).get('type', {})
+        return {
+            'event_id': event['id'],
+            'home_team': home.get('team', {}).get('displayName', 'Unknown'),
+            'away_team': away.get('team', {}).get('displayName', 'Unknown'),
+            'league': league,
+            'status': status_type.get('name', 'Unknown'),
+            'is_live': status_type.get('state', '') == 'in'
+        }
+
+    def _discover_live_games(self, client: 'ESPNClient', league: str) -> List[Game]:
+        """Build Game objects for one league's live scoreboard events.
+
+        The scoreboard event usually embeds the competitors, so discovery
+        normally needs no per-game summary call at all; events missing them
+        fall back to a summary fetch. Those fallbacks run in parallel - each
+        is a full ESPN round trip, so doing them serially would make refresh
+        time scale with game count.
+        """
+        live_ids = []
+        for game_data in client.get_live_games():
+            # ESPN API v3 returns events with 'id' field, not '$ref'
+            event_id = game_data.get('id')
+            if not event_id:
                 continue
-        
-        # Discover College Football games
-        college_games = self.college_client.get_live_games()
-        for game_data in college_games:
+
+            # Only process games that are actually live per the event status
+            status_type = game_data.get('status', {}).get('type', {})
+            if status_type.get('state', '') != 'in':
+                continue
+
+            live_ids.append(event_id)
+
+            if event_id not in self._team_name_cache:
+                names = self._team_names_from_event(game_data)
+                if names:
+                    self._team_name_cache[event_id] = names
+
+        futures = {
+            event_id: self.executor.submit(client.get_game_summary, event_id)
+            for event_id in live_ids
+            if event_id not in self._team_name_cache
+        }
+        league_games = []
+        for event_id in live_ids:
             try:
-                # ESPN API v3 returns events with 'id' field, not '$ref'
-                event_id = game_data.get('id')
-                if not event_id:
-                    continue
-                
-                # Check if game is actually live from the event status
-                status = game_data.get('status', {})
-                status_type = status.get('type', {})
-                is_live = status_type.get('state', '') == 'in'
-                
-                # Only process live games
-                if not is_live:
-                    continue
-                
-                summary = self.college_client.get_game_summary(event_id)
-                
-                if summary and 'boxscore' in summary:
+                if event_id in self._team_name_cache:
+                    home_team, away_team = self._team_name_cache[event_id]
+                else:
+                    summary = futures[event_id].result()
+                    if not summary or 'boxscore' not in summary:
+                        continue
                     teams = summary['boxscore'].get('teams', [])
-                    if len(teams) >= 2:
-                        home_team = teams[1].get('team', {}).get('displayName', 'Unknown')
-                        away_team = teams[0].get('team', {}).get('displayName', 'Unknown')
-                        
-                        game = Game(
-                            event_id=event_id,
-                            home_team=home_team,
-                            away_team=away_team,
-                            league='college-football',
-                            is_live=is_live
-                        )
-                        
-                        game_key = f"{away_team} @ {home_team}"
-                        games[game_key] = game
+                    if len(teams) < 2:
+                        continue
+                    home_team = teams[1].get('team', {}).get('displayName', 'Unknown')
+                    away_team = teams[0].get('team', {}).get('displayName', 'Unknown')
+                    self._team_name_cache[event_id] = (home_team, away_team)
+
+                # Reuse the persistent Game for this event so the per-play
+                # caches carry across polls
+                game = self._games_by_event.get(event_id)
+                if game is None:
+                    game = Game(
+                        event_id=event_id,
+                        home_team=home_team,
+                        away_team=away_team,
+                        league=league,
+                        is_live=True
+                    )
+                    self._games_by_event[event_id] = game
+                league_games.append(game)
             except Exception as e:
-                logger.error(f"Error processing College Football game: {e}")
+                logger.error(f"Error processing {league} game: {e}")
                 continue
-        
-        # Update game states and calculate excitement scores for all games
-        for game_key, game in games.items():
+        return league_games
+
+    def get_live_games(self) -> Dict[str, Game]:
+        """Fetch all current live games from both NFL and College Football and calculate excitement scores"""
+        games: Dict[str, Game] = {}
+
+        # Discovery is identical for both leagues; only the client differs
+        for client, league in ((self.nfl_client, 'nfl'),
+                               (self.college_client, 'college-football')):
+            for game in self._discover_live_games(client, league):
+                games[f"{game.away_team} @ {game.home_team}"] = game
+
+        # Drop games that are no longer live so the persistent map doesn't
+        # accumulate finished events over a full game day
+        live_ids = {game.event_id for game in games.values()}
+        for event_id in list(self._games_by_event):
+            if event_id not in live_ids:
+                del self._games_by_event[event_id]
+
+        # Update game states and calculate excitement scores for all games.
+        # Each update makes its own ESPN calls, so fan the games out across
+        # the pool; a worker only ever mutates its own Game instance, so no
+        # extra locking is needed.
+        def refresh(game: Game) -> None:
             self.update_game_state(game)
             self.check_redzone_activity(game)
             self.calculate_excitement_score(game)
+
+        update_futures = [self.executor.submit(refresh, game) for game in games.values()]
+        for future in update_futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error updating game state: {e}")
         
-        # Filter to only return live games (safety check)
-        live_games = {key: game for key, game in games.items() if game.is_live}
-        
-        return live_games
+        # Discovery only admits live events, so no re-filtering is needed here
+        return games
     
     def get_all_games_today(self) -> List[Dict]:
         """Get all games for today from both NFL and College Football (not just live ones)"""
         try:
-            from datetime import datetime
             today = datetime.now().strftime("%Y%m%d")
+
+            # Serve from cache while fresh - short TTL during live windows,
+            # long otherwise (the day's schedule doesn't change)
+            with self._all_games_lock:
+                if self._all_games_cache is not None:
+                    fetched_at, date_key, ttl, payload = self._all_games_cache
+                    if date_key == today and time.time() - fetched_at < ttl:
+                        return payload
+
             games = []
-            
-            # Get NFL games
-            nfl_url = f"{self.nfl_client.scoreboard_url}?dates={today}"
-            response = self.nfl_client.session.get(nfl_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            for event in data.get('events', []):
-                try:
-                    event_id = event['id']
-                    competitions = event.get('competitions', [])
-                    if competitions:
-                        comp = competitions[0]
-                        competitors = comp.get('competitors', [])
-                        if len(competitors) >= 2:
-                            home = next((c for c in competitors if c.get('homeAway') == 'home'), None)
-                            away = next((c for c in competitors if c.get('homeAway') == 'away'), None)
-                            
-                            if home and away:
-                                games.append({
-                                    'event_id': event_id,
-                                    'home_team': home.get('team', {}).get('displayName', 'Unknown'),
-                                    'away_team': away.get('team', {}).get('displayName', 'Unknown'),
-                                    'league': 'nfl',
-                                    'status': event.get('status', {}).get('type', {}).get('name', 'Unknown'),
-                                    'is_live': event.get('status', {}).get('type', {}).get('state', '') == 'in'
-                                })
-                except Exception as e:
-                    logger.error(f"Error parsing NFL game: {e}")
-                    continue
-            
-            # Get College Football games
-            college_url = f"{self.college_client.scoreboard_url}?dates={today}"
-            response = self.college_client.session.get(college_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            for event in data.get('events', []):
-                try:
-                    event_id = event['id']
-                    competitions = event.get('competitions', [])
-                    if competitions:
-                        comp = competitions[0]
-                        competitors = comp.get('competitors', [])
-                        if len(competitors) >= 2:
-                            home = next((c for c in competitors if c.get('homeAway') == 'home'), None)
-                            away = next((c for c in competitors if c.get('homeAway') == 'away'), None)
-                            
-                            if home and away:
-                                games.append({
-                                    'event_id': event_id,
-                                    'home_team': home.get('team', {}).get('displayName', 'Unknown'),
-                                    'away_team': away.get('team', {}).get('displayName', 'Unknown'),
-                                    'league': 'college-football',
-                                    'status': event.get('status', {}).get('type', {}).get('name', 'Unknown'),
-                                    'is_live': event.get('status', {}).get('type', {}).get('state', '') == 'in'
-                                })
-                except Exception as e:
-                    logger.error(f"Error parsing College Football game: {e}")
-                    continue
-            
+
+            # Same fetch-and-flatten for both leagues; only the client differs.
+            # _get_json gives this path the same orjson parsing and ETag/304
+            # revalidation as the live-scoreboard fetches.
+            for client, league in ((self.nfl_client, 'nfl'),
+                                   (self.college_client, 'college-football')):
+                url = f"{client.scoreboard_url}?dates={today}"
+                data = client._get_json(url)
+
+                for event in data.get('events', []):
+                    try:
+                        parsed = self._parse_scheduled_event(event, league)
+                        if parsed:
+                            games.append(parsed)
+                    except Exception as e:
+                        logger.error(f"Error parsing {league} game: {e}")
+                        continue
+
+            # Refresh quickly while anything is live; otherwise the schedule
+            # is static and can be held for 10 minutes
+            ttl = 30.0 if any(g['is_live'] for g in games) else 600.0
+            with self._all_games_lock:
+                self._all_games_cache = (time.time(), today, ttl, games)
+
             return games
         except Exception as e:
             logger.error(f"Error fetching all games: {e}")
             return []
         
+    def get_status_payload(self) -> List[Dict]:
+        """Build (or reuse) the serialized games list served by /api/status"""
+        with self._status_payload_lock:
+            if (self._status_payload is not None and
+                    time.time() - self._status_payload_ts < self._status_payload_ttl):
+                return self._status_payload
+
+        games = self.get_live_games()
+        payload = [
+            {
+                **game.to_dict(),
+                'game_name': game_key,
+                'last_redzone_time': game.last_redzone_time or 'N/A'
+            }
+            for game_key, game in games.items()
+        ]
+
+        with self._status_payload_lock:
+            self._status_payload = payload
+            self._status_payload_ts = time.time()
+        return payload
+
     # Note: Game-to-channel mapping is now handled client-side in Firebase
-    
+
+    @staticmethod
+    def _apply_score(game: Game, side: str, new_score: int) -> None:
+        """Record one side's score, flagging a change ('home' or 'away')"""
+        current = game.home_score if side == 'home' else game.away_score
+        if current != new_score:
+            # Score changed - track the change (the triggering play sequence
+            # is stored later, once the last play has been parsed)
+            game.score_just_changed = True
+            game.score_change_time = time.time()
+            setattr(game, f'last_{side}_score', current)
+            logger.debug("Score changed for %s vs %s: %s -> %s (commercials coming, reducing priority)", game.home_team, game.away_team, current, new_score)
+        setattr(game, f'{side}_score', new_score)
+
     def update_game_state(self, game: Game) -> None:
         """Update comprehensive game state including scores, timeouts, clock, and possession"""
         # Use the appropriate ESPN client based on game's league
         espn_client = self.nfl_client if game.league == 'nfl' else self.college_client
         
-        # Get game summary first (for scores, clock, and possessionText)
-        summary = espn_client.get_game_summary(game.event_id)
-        
-        # Try to get possessionText from summary API first (most reliable)
-        possession_text = ''
-        if summary:
-            try:
-                # Path: data["competitions"][0]["situation"]["possessionText"]
-                header = summary.get('header', {})
-                competitions = header.get('competitions', [])
-                if competitions:
-                    situation = competitions[0].get('situation', {})
-                    possession_text = situation.get('possessionText', '')
-            except (KeyError, IndexError, AttributeError) as e:
-                logger.debug(f"Could not get possessionText from summary API: {e}")
-        
-        # Fallback to scoreboard API if summary didn't have possessionText
-        situation = None
-        if not possession_text:
-            situation = espn_client.get_game_situation(game.event_id)
-            if situation:
-                possession_text = situation.get('possessionText', '')
-        
-        # If we still don't have situation data, get it from scoreboard for other fields
-        if not situation:
-            situation = espn_client.get_game_situation(game.event_id)
-        
-        if not situation and not summary:
+        # Everything needed here - possession, scores, clock, last play - is
+        # on the cached scoreboard event; the much larger summary download
+        # (boxscore, drives, etc.) is no longer pulled per state update
+        situation = espn_client.get_game_situation(game.event_id)
+        event = espn_client.get_event(game.event_id)
+
+        if not situation and not event:
             return
+
+        possession_text = situation.get('possessionText', '') if situation else ''
         
         # Extract other play information from situation (if available)
         last_play = situation.get('lastPlay', {}) if situation else {}
@@ -433,22 +794,19 @@ class NFLRedzoneController:
         # Method 1: PRIMARY - Use possessionText from ESPN API (shorthand team name like "DAL", "BYU", etc.)
         if possession_text:
             possession_upper = possession_text.upper().strip()
-            home_upper = game.home_team.upper()
-            away_upper = game.away_team.upper()
-            
+
             # Since possessionText is a shorthand (e.g., "DAL", "BYU"), we need to match it against team names
             # Check if shorthand matches home team (e.g., "DAL" in "Dallas Cowboys")
-            if (possession_upper in home_upper or 
-                any(word.startswith(possession_upper) for word in home_upper.split() if len(possession_upper) >= 2) or
-                any(possession_upper in word for word in home_upper.split() if len(word) >= len(possession_upper))):
+            # The old per-word startswith/in scans were all implied by the
+            # plain substring check, so a single pass over the cached
+            # uppercased name covers them
+            if possession_upper in game._home_upper:
                 game.possession_team = game.home_team
-                logger.debug(f"Determined possession from possessionText: {game.home_team} (text: '{possession_text}')")
+                logger.debug("Determined possession from possessionText: %s (text: '%s')", game.home_team, possession_text)
             # Check if shorthand matches away team
-            elif (possession_upper in away_upper or 
-                  any(word.startswith(possession_upper) for word in away_upper.split() if len(possession_upper) >= 2) or
-                  any(possession_upper in word for word in away_upper.split() if len(word) >= len(possession_upper))):
+            elif possession_upper in game._away_upper:
                 game.possession_team = game.away_team
-                logger.debug(f"Determined possession from possessionText: {game.away_team} (text: '{possession_text}')")
+                logger.debug("Determined possession from possessionText: %s (text: '%s')", game.away_team, possession_text)
         
         # Method 2: Fallback to lastPlay.team if possessionText didn't work
         if not game.possession_team and team_with_ball:
@@ -458,107 +816,83 @@ class NFLRedzoneController:
             # Match team name to home or away team
             if team_name and (team_name in game.home_team or game.home_team in team_name):
                 game.possession_team = game.home_team
-                logger.debug(f"Determined possession from lastPlay.team: {game.home_team}")
+                logger.debug("Determined possession from lastPlay.team: %s", game.home_team)
             elif team_name and (team_name in game.away_team or game.away_team in team_name):
                 game.possession_team = game.away_team
-                logger.debug(f"Determined possession from lastPlay.team: {game.away_team}")
+                logger.debug("Determined possession from lastPlay.team: %s", game.away_team)
         
         # Method 3: Fallback to parsing last_play_text if other methods didn't work
         if not game.possession_team and last_play:
             play_text = last_play.get('text', '')
             if play_text:
-                import re
-                # Look for patterns like "to the PSU13", "at DAL20", "to WSH5", etc.
                 # Extract team abbreviation from location (e.g., "PSU" from "PSU13")
-                location_pattern = r'to\s+(?:the\s+)?([A-Z]{2,4})\d+|at\s+([A-Z]{2,4})\d+'
-                match = re.search(location_pattern, play_text, re.IGNORECASE)
+                match = POSSESSION_LOCATION_RE.search(play_text)
                 
                 if match:
                     # Get the team abbreviation (either from first or second group)
                     team_abbrev = (match.group(1) or match.group(2)).upper()
-                    
-                    # Match abbreviation against team names
-                    home_upper = game.home_team.upper()
-                    away_upper = game.away_team.upper()
-                    
+
                     # Check if abbreviation matches home team
                     # Common patterns: "PSU" in "Penn State", "DAL" in "Dallas Cowboys", etc.
-                    if (team_abbrev in home_upper or 
-                        any(word.startswith(team_abbrev[:2]) for word in home_upper.split() if len(word) >= 2)):
+                    # The two-letter prefix lookup replaces the old per-word
+                    # startswith scan with an O(1) frozenset membership test
+                    if (team_abbrev in game._home_upper or
+                            team_abbrev[:2] in game._home_word_prefixes):
                         # Ball is on home team's side, so away team has possession
                         game.possession_team = game.away_team
-                        logger.debug(f"Determined possession from play text: {game.away_team} (ball at {team_abbrev} yard line)")
+                        logger.debug("Determined possession from play text: %s (ball at %s yard line)", game.away_team, team_abbrev)
                     # Check if abbreviation matches away team
-                    elif (team_abbrev in away_upper or 
-                          any(word.startswith(team_abbrev[:2]) for word in away_upper.split() if len(word) >= 2)):
+                    elif (team_abbrev in game._away_upper or
+                          team_abbrev[:2] in game._away_word_prefixes):
                         # Ball is on away team's side, so home team has possession
                         game.possession_team = game.home_team
-                        logger.debug(f"Determined possession from play text: {game.home_team} (ball at {team_abbrev} yard line)")
-        
-        # Get game summary for scores and clock (if not already fetched)
-        if not summary:
-            summary = espn_client.get_game_summary(game.event_id)
+                        logger.debug("Determined possession from play text: %s (ball at %s yard line)", game.home_team, team_abbrev)
         
-        if summary:
-            header = summary.get('header', {})
-            competitions = header.get('competitions', [{}])[0]
-            
+        # Scores and clock from the scoreboard event
+        if event:
+            competitions = event.get('competitions', [{}])[0]
+
             # Get scores and detect score changes
             competitors = competitions.get('competitors', [])
             for comp in competitors:
                 score = int(comp.get('score', 0))
-                if comp.get('homeAway') == 'home':
-                    # Check if score changed (compare with current score before updating)
-                    if game.home_score != score:
-                        # Score changed - track the change
-                        game.score_just_changed = True
-                        game.score_change_time = time.time()
-                        game.last_home_score = game.home_score  # Store previous score
-                        # Store the play sequence when score changed (will be set later)
-                        logger.info(f"Score changed for {game.home_team} vs {game.away_team}: {game.last_home_score} -> {score} (commercials coming, reducing priority)")
-                    game.home_score = score
-                else:
-                    # Check if score changed (compare with current score before updating)
-                    if game.away_score != score:
-                        # Score changed - track the change
-                        game.score_just_changed = True
-                        game.score_change_time = time.time()
-                        game.last_away_score = game.away_score  # Store previous score
-                        # Store the play sequence when score changed (will be set later)
-                        logger.info(f"Score changed for {game.home_team} vs {game.away_team}: {game.last_away_score} -> {score} (commercials coming, reducing priority)")
-                    game.away_score = score
+                side = 'home' if comp.get('homeAway') == 'home' else 'away'
+                self._apply_score(game, side, score)
             
             # Get period and clock
             status = competitions.get('status', {})
             game.quarter = status.get('period', 0)
             clock_display = status.get('displayClock', '0:00')
             
-            # Convert clock to seconds
-            try:
-                if ':' in clock_display:
-                    parts = clock_display.split(':')
-                    game.clock_seconds = int(parts[0]) * 60 + int(parts[1])
-                else:
-                    game.clock_seconds = 0
-            except:
+            # Convert "MM:SS" clock to seconds - validated up front instead of
+            # relying on exception control flow, so malformed clocks take the
+            # cheap branch rather than an exception unwind
+            mm, _, ss = clock_display.partition(':')
+            if mm.isdigit() and ss.isdigit():
+                game.clock_seconds = int(mm) * 60 + int(ss)
+            else:
                 game.clock_seconds = 0
         
         # Check for timeout or end of period
-        last_play = situation.get('lastPlay', {})
+        last_play = situation.get('lastPlay', {}) if situation else {}
         play_type = last_play.get('type', {})
         play_type_text = play_type.get('text', '').lower()
         play_text = last_play.get('text', '').lower()
-        
+
+        # One compiled scan per string for all break keywords
+        play_hits = set(PLAY_BREAK_RE.findall(play_text))
+        type_hits = set(PLAY_BREAK_RE.findall(play_type_text))
+
         # Get current play ID for tracking
         play_id = last_play.get('id', '')
-        
+
         # Detect timeouts
-        if 'timeout' in play_type_text or 'timeout' in play_text:
+        if 'timeout' in type_hits or 'timeout' in play_hits:
             if not game.is_timeout:
                 game.is_timeout = True
                 game.timeout_start_time = time.time()
                 game.last_timeout_play_sequence = play_id
-                logger.info(f"Timeout detected for {game.home_team} vs {game.away_team} - commercials coming, reducing priority")
+                logger.debug("Timeout detected for %s vs %s - commercials coming, reducing priority", game.home_team, game.away_team)
         else:
             # No timeout in current play - check if we should clear timeout flag
             if game.is_timeout:
@@ -570,25 +904,24 @@ class NFLRedzoneController:
                 if play_id and game.last_timeout_play_sequence and play_id != game.last_timeout_play_sequence:
                     # New play detected - timeout is over
                     should_clear = True
-                    logger.info(f"Timeout cleared for {game.home_team} vs {game.away_team} - new play detected (play resumed)")
+                    logger.debug("Timeout cleared for %s vs %s - new play detected (play resumed)", game.home_team, game.away_team)
                 elif game.timeout_start_time and time.time() - game.timeout_start_time > 120:  # 2 minutes (timeouts are usually shorter)
                     # Timeout expired after 2 minutes
                     should_clear = True
-                    logger.info(f"Timeout expired for {game.home_team} vs {game.away_team} (2 minutes)")
-                elif play_text and hasattr(game, '_last_timeout_play_text') and play_text != game._last_timeout_play_text:
+                    logger.debug("Timeout expired for %s vs %s (2 minutes)", game.home_team, game.away_team)
+                elif play_text and game._last_timeout_play_text is not None and play_text != game._last_timeout_play_text:
                     # Play text changed - new play occurred, timeout is over
                     should_clear = True
-                    logger.info(f"Timeout cleared for {game.home_team} vs {game.away_team} - play text changed (play resumed)")
+                    logger.debug("Timeout cleared for %s vs %s - play text changed (play resumed)", game.home_team, game.away_team)
                 
                 if should_clear:
                     game.is_timeout = False
                     game.timeout_start_time = None
                     game.last_timeout_play_sequence = None
-                    if hasattr(game, '_last_timeout_play_text'):
-                        delattr(game, '_last_timeout_play_text')
+                    game._last_timeout_play_text = None
                 else:
                     # Store the play text when timeout occurred to detect changes
-                    if not hasattr(game, '_last_timeout_play_text'):
+                    if game._last_timeout_play_text is None:
                         game._last_timeout_play_text = play_text
         
         # Check if score change timeout should be cleared
@@ -601,32 +934,29 @@ class NFLRedzoneController:
             if play_id and game.last_score_change_play_sequence and play_id != game.last_score_change_play_sequence:
                 # New play detected after score change - commercial break is over
                 should_clear_score = True
-                logger.info(f"Score change commercial cleared for {game.home_team} vs {game.away_team} - new play detected (commercial over)")
+                logger.debug("Score change commercial cleared for %s vs %s - new play detected (commercial over)", game.home_team, game.away_team)
             elif game.score_change_time and time.time() - game.score_change_time > 30:  # 30 seconds (commercials are usually short)
                 # Score change timeout expired after 30 seconds
                 should_clear_score = True
-                logger.info(f"Score change timeout expired for {game.home_team} vs {game.away_team} (30 seconds)")
-            elif play_text and hasattr(game, '_last_commercial_play_text') and play_text != game._last_commercial_play_text:
+                logger.debug("Score change timeout expired for %s vs %s (30 seconds)", game.home_team, game.away_team)
+            elif play_text and game._last_commercial_play_text is not None and play_text != game._last_commercial_play_text:
                 # Play text changed - new play occurred, commercial is over
                 should_clear_score = True
-                logger.info(f"Score change commercial cleared for {game.home_team} vs {game.away_team} - play text changed (commercial over)")
+                logger.debug("Score change commercial cleared for %s vs %s - play text changed (commercial over)", game.home_team, game.away_team)
             
             if should_clear_score:
                 game.score_just_changed = False
                 game.score_change_time = None
                 game.last_score_change_play_sequence = None
-                if hasattr(game, '_last_commercial_play_text'):
-                    delattr(game, '_last_commercial_play_text')
+                game._last_commercial_play_text = None
             else:
                 # Store the play text when score changed to detect changes
-                if not hasattr(game, '_last_commercial_play_text'):
+                if game._last_commercial_play_text is None:
                     game._last_commercial_play_text = play_text
         
         # Detect end of period (quarter/half)
-        game.is_end_of_period = (game.clock_seconds == 0 or 
-                                   'end of' in play_text or 
-                                   'end quarter' in play_text or
-                                   'end half' in play_text)
+        game.is_end_of_period = (game.clock_seconds == 0 or
+                                 bool(play_hits & END_OF_PERIOD_HITS))
         
         # Calculate excitement score (for dynamic priority)
         # Factors: closeness, score total, time remaining
@@ -637,14 +967,8 @@ class NFLRedzoneController:
         excitement = 0.0
         
         # Close game bonus (tiered - heavily favors very close games)
-        if score_diff <= 3:
-            excitement += 1000  # 0-3 points: 100 points (one possession game!)
-        elif score_diff <= 7:
-            excitement += 500   # 4-7 points: 50 points (one score game)
-        elif score_diff <= 10:
-            excitement += 200   # 8-10 points: 20 points (close game)
-        elif score_diff <= 14:
-            excitement += 50    # 11-14 points: 5 points (somewhat close)
+        if score_diff < len(CLOSE_GAME_BONUS):
+            excitement += CLOSE_GAME_BONUS[score_diff]
         
         # High scoring bonus
         if total_score > 40:
@@ -653,8 +977,11 @@ class NFLRedzoneController:
         # Last 15 minutes of 4th quarter bonus
         if game.quarter == 4 and time_remaining_minutes <= 15:
             excitement += (15 - time_remaining_minutes) * 3  # Up to 45 points
-        
-        game.game_excitement_score = excitement
+
+        # Stash the base separately; calculate_excitement_score folds it into
+        # the final score so the published field is written exactly once and
+        # never read back as its own input
+        game._base_excitement = excitement
     
     def check_redzone_activity(self, game: Game) -> Optional[Tuple[str, int]]:
         """Check if any team is in the redzone using ESPN v3 situation data"""
@@ -664,13 +991,26 @@ class NFLRedzoneController:
         situation = espn_client.get_game_situation(game.event_id)
         if not situation:
             game.in_redzone = False
+            game._redzone_result = None
             return None
         
         # Get last play info
         last_play = situation.get('lastPlay', {})
         play_text = last_play.get('text', 'Unknown play')
         play_id = last_play.get('id', 'Unknown')
-        
+
+        # Dominant case: the same play as last poll, so every parse below
+        # would recompute identical state. Serve the cached result instead;
+        # play_timestamp/last_redzone_time deliberately keep marking the
+        # last play change rather than the last poll.
+        if play_id != 'Unknown' and play_id == game._last_play_id:
+            # Score can change between polls of the same play - still record
+            # which play it happened on
+            if game.score_just_changed and not game.last_score_change_play_sequence:
+                game.last_score_change_play_sequence = play_id
+            logger.debug("Same play ID %s for %s", play_id, game.home_team)
+            return game._redzone_result
+
         # Get drive info - this has the ACTUAL field position!
         drive = last_play.get('drive', {})
         drive_end = drive.get('end', {})
@@ -695,29 +1035,25 @@ class NFLRedzoneController:
                     # Get which team has the ball from the last play
                     team_with_ball_id = last_play.get('team', {}).get('id')
                     
-                    # Map team abbreviations to full names
                     # The team whose yard line it is = the DEFENDING team
                     # So the OTHER team has the ball
-                    team_abbrev_map = {
-                        'DAL': 'Dallas Cowboys',
-                        'WSH': 'Washington Commanders',
-                        'WAS': 'Washington Commanders',
-                        'NYG': 'New York Giants',
-                        'DEN': 'Denver Broncos',
-                        'IND': 'Indianapolis Colts',
-                        'LAC': 'Los Angeles Chargers'
-                    }
-                    
-                    defending_team_name = team_abbrev_map.get(defending_team_abbrev, defending_team_abbrev)
-                    
-                    # The team WITH the ball is the one NOT defending
-                    if defending_team_name in game.home_team or any(abbr in game.home_team.upper() for abbr in [defending_team_abbrev]):
+                    defending_team_name = TEAM_ABBREV_MAP.get(defending_team_abbrev, defending_team_abbrev)
+
+                    # The team WITH the ball is the one NOT defending. Known
+                    # abbreviations resolve by direct equality first; the
+                    # substring checks (against the cached uppercased name)
+                    # remain for college teams and unusual forms.
+                    if defending_team_abbrev == NAME_TO_ABBREV.get(game.home_team):
+                        team_name = game.away_team
+                    elif defending_team_abbrev == NAME_TO_ABBREV.get(game.away_team):
+                        team_name = game.home_team
+                    elif defending_team_name in game.home_team or defending_team_abbrev in game._home_upper:
                         # Defending team is home team, so away team has the ball
                         team_name = game.away_team
                     else:
                         # Defending team is away team, so home team has the ball
                         team_name = game.home_team
-                    
+
                 except ValueError:
                     pass
         
@@ -730,81 +1066,72 @@ class NFLRedzoneController:
         game.down = None
         game.distance = None
         if down_distance:
-            down_distance_lower = down_distance.lower()
             # Parse down
-            if '1st' in down_distance_lower or 'first' in down_distance_lower:
-                game.down = 1
-            elif '2nd' in down_distance_lower or 'second' in down_distance_lower:
-                game.down = 2
-            elif '3rd' in down_distance_lower or 'third' in down_distance_lower:
-                game.down = 3
-            elif '4th' in down_distance_lower or 'fourth' in down_distance_lower:
-                game.down = 4
-            
+            down_match = DOWN_RE.search(down_distance)
+            if down_match:
+                game.down = DOWN_MAP[down_match.group(0).lower()]
+
             # Parse distance (yards to go) - look for "& X" pattern
-            import re
-            distance_match = re.search(r'&\s*(\d+)', down_distance)
+            distance_match = DISTANCE_RE.search(down_distance)
             if distance_match:
                 try:
                     game.distance = int(distance_match.group(1))
                 except ValueError:
                     pass
         
-        # Store play information
+        # Store play information (one datetime.now() per call - it allocates
+        # and does a TZ lookup, so don't repeat it per field)
+        now = datetime.now()
         game.play_sequence = play_id
         game.last_play_text = play_text[:100]
-        game.play_timestamp = datetime.now().isoformat()
+        game.play_timestamp = now.isoformat()
         game.yards_to_endzone = yards_to_endzone
         
         # If score just changed, store the play sequence for tracking (if not already set)
         if game.score_just_changed and not game.last_score_change_play_sequence:
             game.last_score_change_play_sequence = play_id
         
-        # Check if this is the same play we saw last time (stale data detection)
-        if hasattr(game, '_last_play_id') and game._last_play_id == play_id:
-            logger.debug(f"Same play ID {play_id} for {game.home_team}")
-        else:
-            game._last_play_id = play_id
-            logger.debug(f"New play for {game.home_team}: {play_text[:50]}")
-        
+        # A new (or unidentified) play - remember it for the short-circuit above
+        game._last_play_id = play_id
+        logger.debug("New play for %s: %s", game.home_team, play_text[:50])
+
         # Check if in redzone (< 30 yards to endzone OR ESPN marks it)
         if (yards_to_endzone is not None and yards_to_endzone < 30) or is_redzone_flag:
             # If team_name is still 'Unknown', try to use possession_team as fallback
             if team_name == 'Unknown' and game.possession_team:
                 team_name = game.possession_team
-                logger.debug(f"Using possession_team as fallback for redzone: {team_name}")
+                logger.debug("Using possession_team as fallback for redzone: %s", team_name)
             
             # If still unknown and we have possession_text, try to parse it
             if team_name == 'Unknown' and possession_text:
                 # possession_text is usually a shorthand like "DAL", "BAL", etc.
                 # Try to match it against home/away team names
                 possession_upper = possession_text.upper().strip()
-                home_upper = game.home_team.upper()
-                away_upper = game.away_team.upper()
-                
-                # Check if shorthand matches home team
-                if (possession_upper in home_upper or 
-                    any(word.startswith(possession_upper) for word in home_upper.split() if len(possession_upper) >= 2)):
+
+                # Check if shorthand matches home team (the old startswith
+                # scan was implied by the substring check on the full name)
+                if possession_upper in game._home_upper:
                     team_name = game.home_team
-                    logger.debug(f"Matched possession_text '{possession_text}' to home team: {team_name}")
+                    logger.debug("Matched possession_text '%s' to home team: %s", possession_text, team_name)
                 # Check if shorthand matches away team
-                elif (possession_upper in away_upper or 
-                      any(word.startswith(possession_upper) for word in away_upper.split() if len(possession_upper) >= 2)):
+                elif possession_upper in game._away_upper:
                     team_name = game.away_team
-                    logger.debug(f"Matched possession_text '{possession_text}' to away team: {team_name}")
+                    logger.debug("Matched possession_text '%s' to away team: %s", possession_text, team_name)
             
             # Update game status
             game.in_redzone = True
             game.last_redzone_team = team_name
-            game.last_redzone_time = datetime.now().strftime("%H:%M:%S")
+            game.last_redzone_time = now.strftime("%H:%M:%S")
             
             # Log with details
-            logger.info(f"Redzone: {team_name} at {yards_to_endzone} yards - {drive_end_text} - {down_distance}")
-            
-            return team_name, yards_to_endzone if yards_to_endzone else 20
+            logger.debug("Redzone: %s at %s yards - %s - %s", team_name, yards_to_endzone, drive_end_text, down_distance)
+
+            game._redzone_result = (team_name, yards_to_endzone if yards_to_endzone else 20)
+            return game._redzone_result
         else:
             game.in_redzone = False
-        
+
+        game._redzone_result = None
         return None
     
     def calculate_excitement_score(self, game: Game) -> None:
@@ -823,10 +1150,10 @@ class NFLRedzoneController:
             # Bonus for 4th and 1 (or short) in redzone - team likely going for it!
             if game.down == 4 and game.distance is not None and game.distance <= 1:
                 excitement += 500  # Huge bonus for 4th and 1 in redzone - very exciting!
-                logger.info(f"4th and {game.distance} in redzone for {game.home_team} vs {game.away_team} - likely going for it, increasing excitement")
+                logger.debug("4th and %s in redzone for %s vs %s - likely going for it, increasing excitement", game.distance, game.home_team, game.away_team)
             elif game.down == 4 and game.distance is not None and game.distance <= 3:
                 excitement += 300  # Bonus for 4th and short (2-3 yards) in redzone
-                logger.info(f"4th and {game.distance} in redzone for {game.home_team} vs {game.away_team} - short yardage, increasing excitement")
+                logger.debug("4th and %s in redzone for %s vs %s - short yardage, increasing excitement", game.distance, game.home_team, game.away_team)
             
             # Penalty for timeout or score change (commercials coming!)
             if game.is_timeout:
@@ -837,16 +1164,17 @@ class NFLRedzoneController:
         # Penalty for 4th down when not in redzone (likely punt = commercial after change of possession)
         if game.down == 4 and not game.in_redzone:
             commercial_penalty = max(commercial_penalty, 300)  # Penalty for 4th down punt situation
-            logger.info(f"4th down detected (not in redzone) for {game.home_team} vs {game.away_team} - likely punt, reducing excitement")
+            logger.debug("4th down detected (not in redzone) for %s vs %s - likely punt, reducing excitement", game.home_team, game.away_team)
         
         # Apply commercial penalty
         excitement -= commercial_penalty
         
         # Add base excitement score (close games in 4th quarter)
         # This is already calculated in update_game_state()
-        excitement += game.game_excitement_score
-        
-        # Update the game's excitement score
+        excitement += game._base_excitement
+
+        # Update the game's excitement score - the single write to the
+        # published field, so re-running this method can't compound the base
         game.game_excitement_score = excitement
 
 # User Controller Manager - handles per-user controller instances
@@ -859,19 +1187,34 @@ class UserControllerManager:
     
     def get_controller(self, user_id: str) -> NFLRedzoneController:
         """Get or create a controller for a specific user"""
+        # Steady state is a plain read of an existing entry; dict reads are
+        # atomic under the GIL, so only creation needs the lock. Writers
+        # replace the dict wholesale (copy-on-write) rather than mutating it,
+        # so lock-free readers always see a consistent mapping.
+        existing = self.controllers.get(user_id)
+        if existing is not None:
+            return existing
+
         with self.lock:
-            if user_id not in self.controllers:
-                logger.info(f"Creating new controller for user: {user_id}")
-                self.controllers[user_id] = NFLRedzoneController()
-            return self.controllers[user_id]
-    
+            # Double-check: another request may have created it while we waited
+            existing = self.controllers.get(user_id)
+            if existing is not None:
+                return existing
+
+            logger.info(f"Creating new controller for user: {user_id}")
+            new_controller = NFLRedzoneController()
+            updated = dict(self.controllers)
+            updated[user_id] = new_controller
+            self.controllers = updated
+            return new_controller
+
     def remove_controller(self, user_id: str):
         """Remove a user's controller (e.g., on logout)"""
         with self.lock:
             if user_id in self.controllers:
-                controller = self.controllers[user_id]
-                controller.stop_monitoring()
-                del self.controllers[user_id]
+                updated = dict(self.controllers)
+                del updated[user_id]
+                self.controllers = updated
                 logger.info(f"Removed controller for user: {user_id}")
     
     def list_users(self) -> List[str]:
@@ -887,14 +1230,23 @@ controller = NFLRedzoneController()
 
 def get_controller_for_request() -> NFLRedzoneController:
     """Get the appropriate controller for the current request (user-specific or global)"""
+    # Routes may resolve their controller more than once per request; the
+    # token verification and manager lookup only need to happen the first time
+    ctrl = getattr(g, '_controller', None)
+    if ctrl is not None:
+        return ctrl
+
     user_id = get_user_from_token()
-    
+
     if user_id:
         # Multi-user mode: use user-specific controller
-        return user_controller_manager.get_controller(user_id)
+        ctrl = user_controller_manager.get_controller(user_id)
     else:
         # Single-user mode: use global controller (backward compatible)
-        return controller
+        ctrl = controller
+
+    g._controller = ctrl
+    return ctrl
 
 # Flask Routes
 
@@ -905,24 +1257,15 @@ def index():
 
 @app.route('/api/status')
 def get_status():
-    """Get current games with excitement scores - fetches fresh data on each request"""
+    """Get current games with excitement scores - payload cached briefly between polls"""
     ctrl = get_controller_for_request()
-    
-    # Fetch live games and calculate excitement scores on-demand
-    games = ctrl.get_live_games()
-    
-    games_list = [
-        {
-            **asdict(game),
-            'game_name': game_key,
-            'last_redzone_time': game.last_redzone_time or 'N/A'
-        }
-        for game_key, game in games.items()
-    ]
-    
-    return jsonify({
-        'games': games_list  # Games include excitement_score, redzone info, scores, league, etc.
-    })
+
+    # Games include excitement_score, redzone info, scores, league, etc.
+    response = jsonify({'games': ctrl.get_status_payload()})
+
+    # ETag lets a fast-polling dashboard get a body-less 304 when nothing changed
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    return response.make_conditional(request)
 
 # Note: Channel configuration endpoints removed - channels/priorities stored client-side in Firebase
 
@@ -935,12 +1278,26 @@ def refresh_games():
     # Keeping it for backward compatibility
     return jsonify({'success': True, 'message': 'Games are fetched fresh on each /api/status request'})
 
+@app.route('/api/dashboard', methods=['GET'])
+def get_dashboard():
+    """Everything the dashboard polls in one response - replaces separate
+    /api/status + /api/all_games round trips"""
+    ctrl = get_controller_for_request()
+    return jsonify({
+        'games': ctrl.get_status_payload(),
+        'all_games': ctrl.get_all_games_today()
+    })
+
 @app.route('/api/all_games', methods=['GET'])
 def get_all_games():
     """Get all games for today"""
     ctrl = get_controller_for_request()
     games = ctrl.get_all_games_today()
-    return jsonify({'games': games})
+
+    response = jsonify({'games': games})
+    # Same conditional-request treatment as /api/status
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    return response.make_conditional(request)
 
 # Note: Game-to-channel mapping endpoint removed - handled client-side in Firebase
 
@@ -953,9 +1310,14 @@ def get_all_games():
 # Note: /api/start endpoint removed - server is stateless and fetches data on-demand via /api/status
 
 if __name__ == '__main__':
+    # Opt into the interactive debugger explicitly; default to a threaded
+    # dev server with the reloader off so the controller (and its thread
+    # pool) isn't spawned twice by the watcher process
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
     print("🏈 NFL Redzone TV Controller")
     print("=" * 50)
-    print("Starting web interface in DEBUG mode...")
+    print(f"Starting web interface{' in DEBUG mode' if debug else ''}...")
     print("Open your browser to: http://localhost:8080")
     print("=" * 50)
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    app.run(debug=debug, host='0.0.0.0', port=8080,
+            threaded=True, use_reloader=False)